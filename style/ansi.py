@@ -1,33 +1,73 @@
-"""ANSI color escape codes with backward-compatible lowercase access."""
+"""ANSI color escape codes with lowercase access and single-call colour wrappers."""
 
-from typing import Final
+from typing import Callable, Final
+
+RED: Final = '\033[31m'
+GREEN: Final = '\033[32m'
+YELLOW: Final = '\033[33m'
+BLUE: Final = '\033[34m'
+MAGENTA: Final = '\033[35m'
+CYAN: Final = '\033[36m'
+GREY: Final = '\033[90m'
+SAGE: Final = '\033[38;5;108m'
+ROSE: Final = '\033[38;5;167m'
+LILAC: Final = '\033[38;5;141m'
+RESET: Final = '\033[0m'
+
+# Lowercase aliases, assigned explicitly so linters and editors can resolve them
+red: Final = RED
+green: Final = GREEN
+yellow: Final = YELLOW
+blue: Final = BLUE
+magenta: Final = MAGENTA
+cyan: Final = CYAN
+grey: Final = GREY
+sage: Final = SAGE
+rose: Final = ROSE
+lilac: Final = LILAC
+reset: Final = RESET
 
 _CODES: Final[dict[str, str]] = {
-    'RED': '\033[31m',
-    'GREEN': '\033[32m',
-    'YELLOW': '\033[33m',
-    'BLUE': '\033[34m',
-    'MAGENTA': '\033[35m',
-    'CYAN': '\033[36m',
-    'GREY': '\033[90m',
-    'SAGE': '\033[38;5;108m',
-    'ROSE': '\033[38;5;167m',
-    'LILAC': '\033[38;5;141m',
-    'RESET': '\033[0m',
+    'RED': RED,
+    'GREEN': GREEN,
+    'YELLOW': YELLOW,
+    'BLUE': BLUE,
+    'MAGENTA': MAGENTA,
+    'CYAN': CYAN,
+    'GREY': GREY,
+    'SAGE': SAGE,
+    'ROSE': ROSE,
+    'LILAC': LILAC,
+    'RESET': RESET,
 }
 
-globals().update(_CODES)
-_ALIASES: Final[dict[str, str]] = {name.lower(): name for name in _CODES}
 
-__all__ = sorted(list[str](_ALIASES.keys()) + list[str](_CODES.keys()))
+def _wrapper(name: str, prefix: str) -> Callable[[str], str]:
+    """Return a function that wraps text in *prefix* and the reset code."""
+    suffix = RESET
+
+    def wrap(text: str) -> str:
+        return prefix + text + suffix
 
+    wrap.__name__ = wrap.__qualname__ = name
+    wrap.__doc__ = f'Return *text* coloured {name[:-1]} and reset.'
+    return wrap
 
-def __getattr__(name: str) -> str:
-    alias = _ALIASES.get(name)
-    if alias is None:
-        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
-    return globals()[alias]
 
+# Single-call wrappers such as red_('text'), with the escape strings bound once
+red_ = _wrapper('red_', RED)
+green_ = _wrapper('green_', GREEN)
+yellow_ = _wrapper('yellow_', YELLOW)
+blue_ = _wrapper('blue_', BLUE)
+magenta_ = _wrapper('magenta_', MAGENTA)
+cyan_ = _wrapper('cyan_', CYAN)
+grey_ = _wrapper('grey_', GREY)
+sage_ = _wrapper('sage_', SAGE)
+rose_ = _wrapper('rose_', ROSE)
+lilac_ = _wrapper('lilac_', LILAC)
 
-def __dir__() -> list[str]:
-    return sorted(list[str](globals().keys()) + list[str](_ALIASES.keys()))
+__all__ = sorted(
+    list[str](_CODES.keys())
+    + [name.lower() for name in _CODES]
+    + [f'{name.lower()}_' for name in _CODES if name != 'RESET']
+)
@@ -11,7 +11,9 @@ It defines:
 import re
 import argparse
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
+from weakref import WeakKeyDictionary
 
 
 # ANSI color codes
@@ -30,16 +32,43 @@ class Color(str, Enum):
     LILAC   = "38;5;141"
 
 
+# Escape sequences built once so rendering only concatenates
+_PREFIX = {colour: f"\x1b[{colour.value}m" for colour in Color}
+_RESET = "\x1b[0m"
+
+# Matches the '(default: something)' suffix in help text
+_DEFAULT_RE = re.compile(r"\(default: ([^)]+)\)")
+
+
 def _colourise(text: str, colour_code: Optional[Color]) -> str:
     """Return *text* wrapped in ANSI colour sequence if *colour_code* given."""
     if colour_code is None:
         return text
-    return f"\x1b[{colour_code.value}m{text}\x1b[0m"
+    return _PREFIX[colour_code] + text + _RESET
+
+
+@lru_cache(maxsize=256)
+def _colour_defaults(help_text: str) -> str:
+    """Return *help_text* with the first '(default: ...)' value, and any copies of it, coloured."""
+    match = _DEFAULT_RE.search(help_text)
+    if match:
+        coloured_value = _colourise(match.group(1), Color.YELLOW)
+        help_text = help_text.replace(match.group(0), f"(default: {coloured_value})")
+    return help_text
 
 
 class ColourHelpFormatter(argparse.HelpFormatter):
     """HelpFormatter that adds colour to key parts of the help output."""
 
+    _usage_prefix = _colourise('usage:', Color.GREEN) + ' '
+
+    # Formatters are rebuilt on every print_help, so per-action results live
+    # on the class, weakly keyed by action. Each entry stores the signature it
+    # was built from and is rebuilt when the formatter class or the action's
+    # flags, nargs, metavar or choices differ.
+    _invocation_cache: "WeakKeyDictionary[argparse.Action, tuple]" = WeakKeyDictionary()
+    _args_cache: "WeakKeyDictionary[argparse.Action, tuple]" = WeakKeyDictionary()
+
     def start_section(self, heading: str) -> None:  # type: ignore[override]
         # Section headings such as "optional arguments:" or "positional arguments:"
         coloured_heading = _colourise(heading, Color.GREEN)
@@ -47,11 +76,35 @@ class ColourHelpFormatter(argparse.HelpFormatter):
 
     def add_usage(self, usage, actions, groups, prefix=None):
         if prefix is None:
-            prefix = _colourise('usage:', Color.GREEN) + ' '
+            prefix = self._usage_prefix
         super().add_usage(usage, actions, groups, prefix)
 
+    def _signature(self, action: argparse.Action, *extra) -> tuple:
+        """Return the inputs a cached rendering of *action* depends on."""
+        # Snapshot choices so in-place edits to a choices list are noticed too
+        choices = None if action.choices is None else tuple(action.choices)
+        return (type(self), tuple(action.option_strings), action.nargs,
+                action.metavar, action.dest, choices, *extra)
+
+    def _cached(self, cache: WeakKeyDictionary, action: argparse.Action,
+                signature: tuple, build: Callable[[], str]) -> str:
+        """Return the entry for *action* in *cache*, rebuilding it if *signature* changed."""
+        entry = cache.get(action)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+        value = build()
+        cache[action] = (signature, value)
+        return value
+
     # Colour option strings ("-m", "--model")
     def _format_action_invocation(self, action: argparse.Action) -> str:
+        return self._cached(
+            self._invocation_cache, action, self._signature(action),
+            lambda: self._build_action_invocation(action),
+        )
+
+    def _build_action_invocation(self, action: argparse.Action) -> str:
         # Positional arguments – keep default behaviour
         if not action.option_strings:
             return super()._format_action_invocation(action)
@@ -66,6 +119,13 @@ class ColourHelpFormatter(argparse.HelpFormatter):
         return ", ".join(parts)
 
     def _format_args(self, action, default_metavar):
+        # Usage and option lines both ask for this on every render
+        return self._cached(
+            self._args_cache, action, self._signature(action, default_metavar),
+            lambda: self._build_args(action, default_metavar),
+        )
+
+    def _build_args(self, action, default_metavar):
         # Let the base class build whatever text it wants…
         text = super()._format_args(action, default_metavar)
         # …then wrap it in colour
@@ -74,11 +134,5 @@ class ColourHelpFormatter(argparse.HelpFormatter):
     # Colour default values in help text
     def _get_help_string(self, action: argparse.Action) -> str:  # noqa: N802
         """Return help string with coloured default values (if any)."""
-        help_text = super()._get_help_string(action)
-        # Regex to find '(default: something)' pattern
-        match = re.search(r"\(default: ([^)]+)\)", help_text)
-        if match:
-            value = match.group(1)
-            coloured_value = _colourise(value, Color.YELLOW)
-            help_text = help_text.replace(match.group(0), f"(default: {coloured_value})")
-        return help_text
+        # Cached by the help text itself, so edits to action.help are picked up
+        return _colour_defaults(super()._get_help_string(action))
@@ -1,5 +1,37 @@
 """This script is used to sanitize the file name."""
 import re
+import string
+
+# Pattern to identify text within square brackets
+_BRACKET = re.compile(r'\[([^\]]+)\]')
+_NONALNUM = re.compile(r'[^a-zA-Z0-9.\-_]')
+_RUN = re.compile(r'-{2,}')
+
+# Byte tables for a single translate pass: spaces become hyphens, uppercase
+# becomes lowercase, and every other byte outside [a-zA-Z0-9.-_] is deleted
+_ALLOWED = (string.ascii_letters + string.digits + '.-_').encode('ascii')
+_LOWERCASE = bytes.maketrans(
+    b' ' + string.ascii_uppercase.encode('ascii'),
+    b'-' + string.ascii_lowercase.encode('ascii'),
+)
+_DISALLOWED = bytes(byte for byte in range(256) if byte not in _ALLOWED and byte != ord(' '))
+
+
+def _alphanumeric(text):
+    """Sanitize the main part of the filename."""
+    # Non-ASCII characters are never allowed, so drop them while encoding
+    sanitization = text.encode('ascii', 'ignore')
+    sanitization = sanitization.translate(_LOWERCASE, _DISALLOWED).decode('ascii')
+    sanitization = _RUN.sub('-', sanitization)
+    sanitization = sanitization.strip('-')
+    return sanitization
+
+
+def _hashid(text):
+    """Sanitize the text inside brackets without changing case or collapsing hyphens."""
+    sanitization = _NONALNUM.sub('', text)
+    return sanitization
+
 
 def up(name):
     """
@@ -8,28 +40,11 @@ def up(name):
     converting to lowercase for the main part of the filename,
     while preserving the original case and hyphens inside square brackets.
     """
-    # Pattern to identify text within square brackets
-    bracket_pattern = re.compile(r'\[([^\]]+)\]')
-
-    # Function to sanitize the main part of the filename
-    def alphanumeric(text):
-        sanitization = text.replace(' ', '-')
-        sanitization = re.sub(r'[^a-zA-Z0-9.\-_]', '', sanitization)
-        sanitization = re.sub(r'-{2,}', '-', sanitization)
-        sanitization = sanitization.lower()
-        sanitization = sanitization.strip('-')
-        return sanitization
-
-    # Function to sanitize the text inside brackets without changing case or collapsing hyphens
-    def hashid(text):
-        sanitization = re.sub(r'[^a-zA-Z0-9.\-_]', '', text)
-        return sanitization
-
     # Split the filename into parts outside and inside brackets
-    parts = bracket_pattern.split(name)
+    parts = _BRACKET.split(name)
     sanitized_parts = [
-        f'-[{hashid(part)}]' if index % 2 == 1
-        else alphanumeric(part)
+        f'-[{_hashid(part)}]' if index % 2 == 1
+        else _alphanumeric(part)
         for index, part in enumerate(parts)
     ]
 
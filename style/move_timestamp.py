@@ -1,9 +1,13 @@
 """Recursively rename files by moving timestamp from filename to description."""
 
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import groupby
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 
 # ANSI color escape codes
@@ -15,8 +19,13 @@ ANSI_MAGENTA, ANSI_CYAN, ANSI_GREY, ANSI_RESET = '\033[35m', '\033[36m', '\033[9
 # 2. Plain: YYYY-MM-DD-HH-MM-SS  (e.g., 2025-06-11-18-26-59)
 # 3. Edge case: YYYY-MM-DD_-_HH-MM-SS(-AM|PM)  (e.g., 2025-05-29_-_19-29-55)
 # All formats are normalized to the new standard: YYYY-MM-DD-HH-MM-SS (all dashes, no AM/PM)
+# Every legacy timestamp is from the 2000s, so names without YEAR_HINT skip the regex entirely.
 
-REGEX_PR = r"(.+)-(\d{4}-\d+-\d+(?:-\d+-\d+-\d+(?:-\w+)?|_-_\d+-\d+-\d+(?:-\w+)?))"
+REGEX_PR = re.compile(r"(.+)-(\d{4}-\d+-\d+(?:-\d+-\d+-\d+(?:-\w+)?|_-_\d+-\d+-\d+(?:-\w+)?))")
+YEAR_HINT = '-20'
+
+# Threads used to list directories in parallel; 1 walks serially
+WALK_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 def _build_new_filename(match: re.Match) -> str:
@@ -27,6 +36,62 @@ def _build_new_filename(match: re.Match) -> str:
     return f"{timestamp}-{description}"
 
 
+def _scan(directory: str) -> List[os.DirEntry]:
+    """Return the entries of *directory*, or none if it cannot be read."""
+    try:
+        with os.scandir(directory) as entries:
+            return list(entries)
+    except PermissionError:
+        return []
+
+
+def _list_directory(directory: str) -> Tuple[List[str], List[str]]:
+    """Return (subdirectory paths, YEAR_HINT file names) for *directory*."""
+    subdirs, files = [], []
+    for entry in _scan(directory):
+        # DirEntry answers from the readdir d_type, so on local filesystems neither
+        # check stats; symlinks and filesystems without d_type still stat once
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+            continue
+
+        # Cheap name test first so only likely matches can pay for a stat
+        if YEAR_HINT not in entry.name:
+            continue
+
+        if entry.is_file():
+            files.append(entry.name)
+
+    return subdirs, files
+
+
+def _walk_levels(root_dir: Path, mapper: Callable) -> Iterator[Tuple[str, str]]:
+    """Yield (directory, filename) level by level, listing each level through *mapper*."""
+    level = [str(root_dir)]
+    while level:
+        next_level = []
+        for directory, (subdirs, files) in zip(level, mapper(_list_directory, level)):
+            next_level.extend(subdirs)
+            for filename in files:
+                yield directory, filename
+        level = next_level
+
+
+def _walk_files(root_dir: Path, workers: int = WALK_WORKERS) -> Iterator[Tuple[str, str]]:
+    """Yield (directory, filename) for regular files under *root_dir* whose names carry YEAR_HINT.
+
+    Listing is syscall-bound, so directories on the same level are scanned
+    concurrently. Each worker closes its directory before returning, which
+    keeps open descriptors bounded by *workers*.
+    """
+    if workers <= 1:
+        yield from _walk_levels(root_dir, map)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        yield from _walk_levels(root_dir, pool.map)
+
+
 def find_matching_files(root_dir: Path) -> List[Tuple[Path, str]]:
     """Find all files matching the timestamp pattern.
     
@@ -34,14 +99,12 @@ def find_matching_files(root_dir: Path) -> List[Tuple[Path, str]]:
         List of tuples (file_path, new_filename)
     """
     matches = []
-    for file_path in root_dir.rglob("*"):
-        if file_path.is_file():
-            filename = file_path.name
-            new_filename = re.sub(REGEX_PR, _build_new_filename, filename)
+    for directory, filename in _walk_files(root_dir):
+        new_filename = REGEX_PR.sub(_build_new_filename, filename, count=1)
 
-            # Only include files that would actually be renamed
-            if new_filename != filename:
-                matches.append((file_path, new_filename))
+        # Only include files that would actually be renamed
+        if new_filename != filename:
+            matches.append((Path(directory, filename), new_filename))
 
     return matches
 
@@ -52,14 +115,71 @@ def display_dry_run(matches: List[Tuple[Path, str]]) -> None:
     print(f"{ANSI_YELLOW}DRY RUN{ANSI_RESET} - Files that would be renamed:")
     print(f"{ANSI_BLUE}{'='*80}{ANSI_RESET}\n")
 
-    for file_path, new_filename in matches:
-        print(f"FROM: {ANSI_RED}{file_path.name}{ANSI_RESET}")
-        print(f"  TO: {ANSI_GREEN}{new_filename}{ANSI_RESET}")
-        print()
+    # One write for the whole listing instead of three prints per file
+    sys.stdout.write(''.join(
+        f"FROM: {ANSI_RED}{file_path.name}{ANSI_RESET}\n"
+        f"  TO: {ANSI_GREEN}{new_filename}{ANSI_RESET}\n\n"
+        for file_path, new_filename in matches
+    ))
 
     print(f"\nTotal files to rename: {ANSI_GREEN}{len(matches)}{ANSI_RESET}")
 
 
+@contextmanager
+def _directory_fd(directory: Path) -> Iterator[Optional[int]]:
+    """Yield an open fd for *directory*, or None where dir_fd renames are unavailable."""
+    if os.rename not in os.supports_dir_fd:
+        yield None
+        return
+
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        # Let the per-file path renames report the failure
+        yield None
+        return
+
+    try:
+        yield dir_fd
+    finally:
+        os.close(dir_fd)
+
+
+def _rename(file_path: Path, new_filename: str, dir_fd: Optional[int]) -> None:
+    """Rename *file_path* to *new_filename* within its own directory."""
+    if dir_fd is None:
+        os.rename(file_path, os.path.join(file_path.parent, new_filename))
+        return
+
+    # Resolve both names relative to the open directory, not the full path
+    try:
+        os.rename(file_path.name, new_filename, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+    except OSError as e:
+        # The error only knows the bare names; report full paths so the failing directory shows
+        new_path = os.path.join(file_path.parent, new_filename)
+        raise OSError(e.errno, e.strerror, str(file_path), None, new_path) from e
+
+
+def _rename_directory(directory: Path, group: Iterable[Tuple[Path, str]]) -> Tuple[str, int, int]:
+    """Rename every match in *directory* and return (output, renamed, failed)."""
+    lines = []
+    failed = 0
+    with _directory_fd(directory) as dir_fd:
+        for file_path, new_filename in group:
+            try:
+                _rename(file_path, new_filename, dir_fd)
+            except OSError as e:
+                name_part = f"{ANSI_YELLOW}{file_path.name}{ANSI_RESET}"
+                err_part = f"{ANSI_RED}{e}{ANSI_RESET}"
+                lines.append(f"{ANSI_RED}✗{ANSI_RESET} Error renaming {name_part}: {err_part}\n")
+                failed += 1
+                continue
+
+            lines.append(f"{ANSI_GREEN}✓{ANSI_RESET} {ANSI_CYAN}{file_path.name}{ANSI_RESET}\n")
+
+    return ''.join(lines), len(lines) - failed, failed
+
+
 def rename_files(matches: List[Tuple[Path, str]]) -> None:
     """Actually rename the files."""
     print("\n" + f"{ANSI_BLUE}{'='*80}{ANSI_RESET}")
@@ -69,18 +189,13 @@ def rename_files(matches: List[Tuple[Path, str]]) -> None:
     success_count = 0
     error_count = 0
 
-    for file_path, new_filename in matches:
-        try:
-            new_path = file_path.parent / new_filename
-            file_path.rename(new_path)
-            print(f"{ANSI_GREEN}✓{ANSI_RESET} {ANSI_CYAN}{file_path.name}{ANSI_RESET}")
-            success_count += 1
-        except OSError as e:
-            name_part = f"{ANSI_YELLOW}{file_path.name}{ANSI_RESET}"
-            err_part = f"{ANSI_RED}{e}{ANSI_RESET}"
-            err_msg = f"Error renaming {name_part}: {err_part}"
-            print(f"{ANSI_RED}✗{ANSI_RESET} {err_msg}")
-            error_count += 1
+    # find_matching_files yields each directory's files together, so each
+    # directory is opened once and its results are written in one block
+    for directory, group in groupby(matches, key=lambda match: match[0].parent):
+        block, renamed, failed = _rename_directory(directory, group)
+        sys.stdout.write(block)
+        success_count += renamed
+        error_count += failed
 
     print("\n" + f"{ANSI_BLUE}{'='*80}{ANSI_RESET}")
     renamed_str = f"{ANSI_GREEN}{success_count}{ANSI_RESET} renamed"